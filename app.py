@@ -12,15 +12,14 @@ import streamlit as st
 from services.camara import (
     buscar_proposicoes_por_tema,
     tramitacoes,
-    autores_por_proposicao,
     CamaraAPIError,
 )
+from services.camara_async import enriquecer_lote_sync
 
 from utils.transforms import (
     df_proposicoes,
-    dias_desde,
-    parse_date,
     extrair_autor_principal,
+    parse_datas,
 )
 
 st.set_page_config(page_title="LegiTrack BR", page_icon="📜", layout="wide")
@@ -103,19 +102,21 @@ if btn_buscar:
             st.info("Não há dados suficientes para exibir resultados.")
             st.stop()
 
-        # Recuperar autores (somente NOME)
-        autores_lista = []
-        for _, row_api in df_api.iterrows():
-            try:
-                aut_payload = autores_por_proposicao(int(row_api["id"]))
-                autor_nome = extrair_autor_principal(aut_payload)
-            except Exception:
-                autor_nome = None
-            autores_lista.append(autor_nome)
+        # Recuperar autores (somente NOME), em paralelo
+        ids = [int(i) for i in df_api["id"].dropna()]
+        try:
+            lote = enriquecer_lote_sync(ids, recursos=("autores",))
+        except Exception:
+            lote = {}
+        autores_lista = [
+            None
+            if pd.isna(i)
+            else extrair_autor_principal(lote.get(int(i), {}).get("autores", []))
+            for i in df_api["id"]
+        ]
 
         df = df_api.copy()
         df["autor"] = autores_lista
-        df["dias_desde_status"] = df["data_status"].apply(dias_desde)
 
         # Resumo
         st.caption(
@@ -175,7 +176,7 @@ if btn_buscar:
 
         # 1) Situação
         with g1:
-            sit = df["situacao"].fillna("—").value_counts().reset_index()
+            sit = df["situacao"].astype(object).fillna("—").value_counts().reset_index()
             sit.columns = ["situacao", "quantidade"]
 
             fig1 = px.bar(
@@ -231,9 +232,11 @@ if btn_buscar:
             st.markdown(f"### {row['rotulo']}")
             st.markdown(f"**Autor:** {row['autor'] or '—'}")
             st.markdown(f"**Ementa:** {row['ementa']}")
-            st.markdown(f"**Situação:** {row['situacao'] or '—'}")
-            st.markdown(f"**Tramitação atual:** {row['tramitacao_atual'] or '—'}")
-            if row["data_status"]:
+            situacao = row["situacao"] if pd.notna(row["situacao"]) else "—"
+            tramitacao = row["tramitacao_atual"] if pd.notna(row["tramitacao_atual"]) else "—"
+            st.markdown(f"**Situação:** {situacao}")
+            st.markdown(f"**Tramitação atual:** {tramitacao}")
+            if pd.notna(row["data_status"]):
                 st.markdown(
                     f"**Data do status:** {row['data_status'].date()} "
                     f"({row['dias_desde_status']} dia(s) atrás)"
@@ -246,7 +249,7 @@ if btn_buscar:
 
             if tram:
                 tdf = pd.DataFrame(tram)
-                tdf["dataHora"] = tdf["dataHora"].apply(parse_date)
+                tdf["dataHora"] = parse_datas(tdf["dataHora"])
                 tdf = tdf.dropna(subset=["dataHora"]).sort_values("dataHora")
                 tdf["data"] = tdf["dataHora"].dt.date
 
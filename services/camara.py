@@ -3,58 +3,494 @@
 # Camada de acesso aos Dados Abertos da Câmara dos Deputados
 # para o app LegiTrack BR.
 
-from typing import Optional, List, Dict, Any
+import gzip
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+import warnings
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, NamedTuple, Tuple, Union
+import ahocorasick
+import msgspec
+import orjson
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 
 BASE_API = "https://dadosabertos.camara.leg.br/api/v2"
 BASE_ARQUIVOS = "https://dadosabertos.camara.leg.br/arquivos/proposicoes/json"
 
+# Recursos por proposição (usados pelo cliente síncrono e pelo assíncrono).
+ROTAS_PROPOSICAO = {
+    "detalhes": "/proposicoes/{id}",
+    "tramitacoes": "/proposicoes/{id}/tramitacoes",
+    "autores": "/proposicoes/{id}/autores",
+}
+
+
+def _env_positivo(nome: str, padrao, tipo: type):
+    """Lê uma variável de ambiente numérica > 0; se inválida, avisa e usa o padrão."""
+    bruto = os.environ.get(nome)
+    if bruto is None:
+        return padrao
+    try:
+        valor = tipo(bruto)
+    except ValueError:
+        valor = None
+    if valor is None or not valor > 0:
+        warnings.warn(
+            f"{nome}={bruto!r} inválido (precisa ser um número maior que zero); "
+            f"usando o padrão {padrao}.",
+            RuntimeWarning,
+        )
+        return padrao
+    return valor
+
+
+# Limite de requisições do cliente: TAXA_MAX chamadas a cada TAXA_PERIODO segundos.
+TAXA_MAX = _env_positivo("LEGITRACK_TAXA_MAX", 10, int)
+TAXA_PERIODO = _env_positivo("LEGITRACK_TAXA_PERIODO", 1.0, float)
+
+# Cache local dos arquivos anuais (gzip + ETag/Last-Modified).
+CACHE_DIR = Path(
+    os.environ.get("LEGITRACK_CACHE_DIR", Path.home() / ".cache" / "legitrack")
+)
+CACHE_VALIDADE = 6 * 60 * 60  # segundos até revalidar com o servidor
+TAMANHO_BLOCO = 1 << 20  # bytes por bloco no download em streaming
+MAX_WORKERS_ANOS = 8  # anos baixados/filtrados em paralelo na busca multi-ano
+MAX_INDICES_ANOS = 8  # índices de busca (um por ano) mantidos em memória
 
 class CamaraAPIError(RuntimeError):
     pass
 
 
+class _CacheIndisponivel(CamaraAPIError):
+    """CACHE_DIR não pode ser criado/escrito; o arquivo tem de vir para a memória."""
+
+
+class Proposicao(msgspec.Struct):
+    """
+    Campos do arquivo anual usados na busca; o resto é pulado no parse.
+
+    Os tipos ficam em Any de propósito: um registro fora do padrão (número
+    como string, keywords como lista) não pode derrubar o ano inteiro. A
+    conversão acontece em _montar_indice.
+    """
+
+    siglaTipo: Any = None
+    ementa: Any = None
+    keywords: Any = None
+    ementaDetalhada: Any = None
+    ano: Any = None
+    numero: Any = None
+
+
+_DEC_ENVELOPE = msgspec.json.Decoder(
+    Union[List[msgspec.Raw], Dict[str, msgspec.Raw]]
+)
+_DEC_RAWS = msgspec.json.Decoder(List[msgspec.Raw])
+_DEC_PROPOSICOES = msgspec.json.Decoder(List[Proposicao])
+
+
+# ---------------------------------------------------------
+# Sessão HTTP compartilhada (keep-alive + pool de conexões)
+# ---------------------------------------------------------
+def _criar_sessao() -> requests.Session:
+    sessao = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    )
+    sessao.mount("https://", adapter)
+    # gzip/deflate sempre; br quando o pacote brotli estiver instalado.
+    sessao.headers.update(
+        {"Accept-Encoding": ACCEPT_ENCODING, "User-Agent": "LegiTrack/1.0"}
+    )
+    return sessao
+
+
+SESSION = _criar_sessao()
+
+
+def close_session() -> None:
+    """Fecha as conexões abertas da sessão compartilhada."""
+    SESSION.close()
+
+
+class _TokenBucket:
+    """Token bucket bloqueante e thread-safe para espaçar as requisições."""
+
+    def __init__(self, taxa: int, periodo: float):
+        self.capacidade = float(taxa)
+        self.intervalo = periodo / taxa
+        self._tokens = float(taxa)
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def aguardar(self) -> None:
+        with self._lock:
+            agora = time.monotonic()
+            self._tokens = min(
+                self.capacidade,
+                self._tokens + (agora - self._ultimo) / self.intervalo,
+            )
+            self._ultimo = agora
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) * self.intervalo)
+                self._ultimo = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1
+
+
+_LIMITADOR = _TokenBucket(TAXA_MAX, TAXA_PERIODO)
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """GET pela sessão compartilhada, respeitando o limite de taxa."""
+    _LIMITADOR.aguardar()
+    return SESSION.get(url, **kwargs)
+
+
+def _loads(content: bytes) -> Any:
+    """Decodifica JSON com orjson (bem mais rápido que o json da stdlib)."""
+    return orjson.loads(content)
+
+
+def _dados(payload: Any, tipo: type) -> Any:
+    """Extrai o campo "dados" da resposta, com fallback para o tipo vazio."""
+    if isinstance(payload, dict) and "dados" in payload:
+        payload = payload["dados"]
+    return payload if isinstance(payload, tipo) else tipo()
+
+
 def _get_api(path: str, params: Optional[dict] = None, timeout: int = 25) -> dict:
     """
-    Chamada genérica para a API REST (/api/v2/...).
+    Chamada genérica para a API REST (/api/v2/...). Aceita também a URL
+    completa, como nos links de paginação.
     """
-    url = f"{BASE_API}{path}"
+    url = path if path.startswith("http") else f"{BASE_API}{path}"
     try:
-        r = requests.get(url, params=params, timeout=timeout)
+        r = _get(url, params=params, timeout=timeout)
         r.raise_for_status()
-        return r.json()
-    except requests.RequestException as e:
+        return _loads(r.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         raise CamaraAPIError(f"Erro ao consultar a API da Câmara ({url}): {e}") from e
 
 
-def _get_arquivo_proposicoes_ano(ano: int, timeout: int = 40) -> List[Dict[str, Any]]:
+def _ler_meta(caminho: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(caminho.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _caminhos_cache(ano: int) -> Tuple[Path, Path]:
+    return (
+        CACHE_DIR / f"proposicoes-{ano}.json.gz",
+        CACHE_DIR / f"proposicoes-{ano}.meta.json",
+    )
+
+
+def _cache_fresco(meta: Dict[str, Any]) -> bool:
+    return bool(meta) and time.time() - meta.get("verificado_em", 0) < CACHE_VALIDADE
+
+
+def _tmp_no_cache(prefixo: str) -> Path:
+    """Cria um arquivo temporário exclusivo dentro de CACHE_DIR."""
+    with tempfile.NamedTemporaryFile(
+        dir=CACHE_DIR, prefix=prefixo, suffix=".tmp", delete=False
+    ) as f:
+        return Path(f.name)
+
+
+def _baixar_arquivo_ano(ano: int, timeout: int = 40) -> Path:
+    """
+    Garante uma cópia local (gzip) de proposicoes-{ano}.json e devolve o caminho.
+
+    Dentro de CACHE_VALIDADE o arquivo em disco é usado direto; depois disso
+    o servidor é consultado com If-None-Match/If-Modified-Since e só baixa
+    de novo se o arquivo tiver mudado.
+    """
+    url = f"{BASE_ARQUIVOS}/proposicoes-{ano}.json"
+    destino, meta_path = _caminhos_cache(ano)
+
+    meta = _ler_meta(meta_path) if destino.exists() else {}
+    if _cache_fresco(meta):
+        return destino
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Nome único por download: sessões concorrentes não escrevem no mesmo tmp.
+        tmp = _tmp_no_cache(f"proposicoes-{ano}-")
+    except OSError as e:
+        raise _CacheIndisponivel(f"Cache indisponível em {CACHE_DIR}: {e}") from e
+
+    try:
+        # stream=True: o corpo (já descomprimido pelo urllib3) vai em blocos
+        # direto para o gzip em disco, sem montar o arquivo inteiro em memória.
+        with _get(url, headers=headers, timeout=timeout, stream=True) as r:
+            if r.status_code == 304:
+                meta["verificado_em"] = time.time()
+            else:
+                r.raise_for_status()
+                with gzip.open(tmp, "wb", compresslevel=5) as f:
+                    for bloco in r.iter_content(chunk_size=TAMANHO_BLOCO):
+                        f.write(bloco)
+                os.replace(tmp, destino)
+                meta = {
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"),
+                    "verificado_em": time.time(),
+                }
+    except requests.RequestException as e:
+        # Sem rede, uma cópia antiga ainda é melhor do que nada.
+        if meta and destino.exists():
+            return destino
+        raise CamaraAPIError(
+            f"Erro ao baixar arquivo de proposições de {ano} ({url}): {e}"
+        ) from e
+    except OSError as e:
+        # Disco cheio/sem permissão no meio da gravação.
+        raise _CacheIndisponivel(f"Erro ao gravar {destino}: {e}") from e
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    _gravar_meta(ano, meta)
+    return destino
+
+
+def _gravar_meta(ano: int, meta: Dict[str, Any]) -> None:
     """
-    Baixa o arquivo JSON de proposições de um determinado ano:
-    https://dadosabertos.camara.leg.br/arquivos/proposicoes/json/proposicoes-{ano}.json
+    Grava o meta do cache. Falhar aqui não invalida o download já feito:
+    sem meta, a próxima busca só baixa o arquivo de novo.
     """
+    _, meta_path = _caminhos_cache(ano)
+    try:
+        tmp_meta = _tmp_no_cache(f"proposicoes-{ano}-meta-")
+    except OSError:
+        return
+    try:
+        tmp_meta.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_meta, meta_path)
+    except OSError:
+        pass
+    finally:
+        tmp_meta.unlink(missing_ok=True)
+
+
+def _baixar_em_memoria(ano: int, timeout: int = 40) -> bytes:
+    """Baixa proposicoes-{ano}.json sem passar pelo disco (cache indisponível)."""
     url = f"{BASE_ARQUIVOS}/proposicoes-{ano}.json"
     try:
-        r = requests.get(url, timeout=timeout)
+        r = _get(url, timeout=timeout)
         r.raise_for_status()
-        data = r.json()
-
-        if isinstance(data, dict):
-            if "dados" in data and isinstance(data["dados"], list):
-                return data["dados"]
-            for key in ("proposicoes", "lista", "itens"):
-                if key in data and isinstance(data[key], list):
-                    return data[key]
-            return [data]
-        elif isinstance(data, list):
-            return data
-        else:
-            return []
+        return r.content
     except requests.RequestException as e:
         raise CamaraAPIError(
             f"Erro ao baixar arquivo de proposições de {ano} ({url}): {e}"
         ) from e
 
 
+def _decodificar_arquivo(
+    conteudo: bytes, nome: str
+) -> Tuple[List[Proposicao], List[msgspec.Raw]]:
+    """
+    Decodifica o arquivo anual direto em structs Proposicao (só os campos da
+    busca) e, em paralelo, nos trechos JSON brutos de cada registro, para
+    que só as proposições encontradas virem dicts completos.
+    """
+    try:
+        envelope = _DEC_ENVELOPE.decode(conteudo)
+        if isinstance(envelope, dict):
+            lista = next(
+                (envelope[k] for k in ("dados", "proposicoes", "lista", "itens") if k in envelope),
+                None,
+            )
+            if lista is None:
+                return [], []
+            return _DEC_PROPOSICOES.decode(lista), _DEC_RAWS.decode(lista)
+
+        return _DEC_PROPOSICOES.decode(conteudo), envelope
+    except msgspec.DecodeError as e:
+        raise CamaraAPIError(
+            f"Arquivo de proposições em formato inesperado ({nome}): {e}"
+        ) from e
+
+
+class _IndiceAno(NamedTuple):
+    """Índice de busca de um ano: metadados em DataFrame + texto normalizado."""
+
+    df: pd.DataFrame  # siglaTipoUp, ano, numero e o JSON bruto ("_bruto")
+    # Textos normalizados (só ASCII) de todos os registros, separados por \n.
+    # Fica como str, já pronto tanto para str.find quanto para o Aho-Corasick.
+    texto: str
+    inicios: array  # posição em `texto` onde começa cada registro
+    # Só para registros com caracteres que não existem em ASCII (€, —, grego,
+    # cirílico...): linha -> texto dobrado mantendo esses caracteres.
+    extras: Dict[int, str]
+
+
+def _inteiro(valor: Any) -> Optional[int]:
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+_RE_ACENTOS = re.compile("[\u0300-\u036f]")
+
+
+def _dobrar(texto: str) -> str:
+    """Minúsculas e sem acentos, mas mantendo símbolos e letras não latinas."""
+    return _RE_ACENTOS.sub("", unicodedata.normalize("NFKD", texto.casefold()))
+
+
+def _agulha(termo: str) -> str:
+    """Forma dobrada do termo; ValueError se não sobrar nada para procurar."""
+    agulha = _dobrar(termo.strip())
+    if not agulha:
+        raise ValueError(f"O termo {termo!r} não tem caracteres pesquisáveis.")
+    return agulha
+
+
+def _montar_indice(conteudo: bytes, nome: str) -> _IndiceAno:
+    """
+    Monta o índice de busca do ano a partir do JSON do arquivo anual.
+
+    Ementa, keywords e ementaDetalhada de cada registro viram uma linha de
+    um único texto; a busca é um str.find sobre esse texto.
+    """
+    props, brutos = _decodificar_arquivo(conteudo, nome)
+
+    df = pd.DataFrame(
+        {
+            "siglaTipoUp": pd.Categorical(
+                [str(p.siglaTipo or "").upper() for p in props]
+            ),
+            "ano": pd.array([_inteiro(p.ano) for p in props], dtype="Int64"),
+            "numero": pd.array([_inteiro(p.numero) for p in props], dtype="Int64"),
+        }
+    )
+    df["_bruto"] = brutos
+
+    linhas: List[str] = []
+    extras: Dict[int, str] = {}
+    for i, p in enumerate(props):
+        dobrado = _dobrar(
+            f"{p.ementa or ''} {p.keywords or ''} {p.ementaDetalhada or ''}"
+        ).replace("\n", " ")
+        if not dobrado.isascii():
+            extras[i] = dobrado
+            dobrado = dobrado.encode("ascii", "ignore").decode("ascii")
+        linhas.append(dobrado)
+
+    inicios = array("q", accumulate((len(l) + 1 for l in linhas), initial=0))
+    inicios.pop()  # o último valor é o fim do texto, não início de registro
+    return _IndiceAno(df, "\n".join(linhas), inicios, extras)
+
+
+# Um índice por ano (o da versão atual do arquivo), em ordem de uso.
+_INDICES: "OrderedDict[int, Tuple[int, _IndiceAno]]" = OrderedDict()
+_INDICES_LOCK = threading.Lock()
+_TRAVAS_ANO: Dict[int, threading.Lock] = {}
+
+
+def _indice_arquivo(ano: int, caminho: Path) -> _IndiceAno:
+    """
+    Índice do arquivo em cache do ano, montado uma vez por versão (mtime).
+
+    Quando o arquivo muda, o índice antigo do ano é substituído, e não
+    guardado ao lado do novo; acima de MAX_INDICES_ANOS anos, sai o usado
+    há mais tempo. A trava por ano evita montar o mesmo índice duas vezes
+    quando várias threads pedem o mesmo ano.
+    """
+    with _INDICES_LOCK:
+        trava = _TRAVAS_ANO.setdefault(ano, threading.Lock())
+
+    with trava:
+        versao = caminho.stat().st_mtime_ns
+        with _INDICES_LOCK:
+            atual = _INDICES.get(ano)
+            if atual and atual[0] == versao:
+                _INDICES.move_to_end(ano)
+                return atual[1]
+
+        with gzip.open(caminho, "rb") as f:
+            indice = _montar_indice(f.read(), caminho.name)
+
+        with _INDICES_LOCK:
+            _INDICES[ano] = (versao, indice)
+            _INDICES.move_to_end(ano)
+            while len(_INDICES) > MAX_INDICES_ANOS:
+                _INDICES.popitem(last=False)
+        return indice
+
+
+def _indice_ano(ano: int, timeout: int = 40) -> _IndiceAno:
+    """Índice de busca do ano; só é refeito quando o arquivo em disco muda."""
+    try:
+        caminho = _baixar_arquivo_ano(ano, timeout=timeout)
+    except _CacheIndisponivel as e:
+        warnings.warn(f"{e}; baixando proposições de {ano} só em memória.", RuntimeWarning)
+        return _montar_indice(
+            _baixar_em_memoria(ano, timeout=timeout), f"proposicoes-{ano}.json"
+        )
+    return _indice_arquivo(ano, caminho)
+
+
+def _buscar_no_texto(indice: _IndiceAno, agulha: str) -> List[int]:
+    """Posições dos registros cujo texto contém `agulha`."""
+    if not agulha.isascii():
+        # Caracteres sem equivalente ASCII só podem estar nos extras.
+        return [i for i, texto in indice.extras.items() if agulha in texto]
+    texto, inicios = indice.texto, indice.inicios
+    achados: List[int] = []
+    pos = texto.find(agulha)
+    while pos != -1:
+        linha = bisect_right(inicios, pos) - 1
+        achados.append(linha)
+        if linha + 1 == len(inicios):
+            break
+        pos = texto.find(agulha, inicios[linha + 1])
+    return achados
+
+
+def _filtro_tipos(siglas: pd.Series, tipos: frozenset) -> pd.Series:
+    """Máscara de tipo testada uma vez por categoria, não uma vez por linha."""
+    permitidos = siglas.cat.categories.isin(tipos)
+    codigos = siglas.cat.codes.to_numpy()
+    return pd.Series(permitidos[codigos] & (codigos >= 0), index=siglas.index)
+
+
+def _decodificar_resultado(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Ordena do mais recente para o mais antigo e devolve os registros originais."""
+    df = df.sort_values(["ano", "numero"], ascending=False, kind="stable")
+    return [msgspec.json.decode(b) for b in df["_bruto"]]
+
+
 def buscar_proposicoes_por_tema(
     termo: str,
     ano: int,
@@ -63,63 +499,198 @@ def buscar_proposicoes_por_tema(
     """
     Busca proposições de um ano específico, filtrando por:
       - tipos (PL, PEC, PLP, MPV, PDC etc.)
-      - presença do termo na ementa, keywords ou ementaDetalhada.
+      - presença do termo na ementa, keywords ou ementaDetalhada
+        (sem diferenciar maiúsculas nem acentos).
+
+    Levanta ValueError se o termo não tiver nada pesquisável.
     """
     if not termo:
         raise ValueError("O termo de busca não pode ser vazio.")
 
-    registros = _get_arquivo_proposicoes_ano(ano)
+    tipos_set = frozenset(t.upper() for t in (tipos or ()))
 
-    termo_lower = termo.lower().strip()
-    tipos = [t.upper() for t in (tipos or [])]
+    # Um único tipo: o filtro do servidor devolve poucas páginas, o que sai
+    # bem mais barato que baixar e indexar o arquivo do ano inteiro.
+    if len(tipos_set) == 1:
+        return _buscar_tipo_unico(termo, ano, next(iter(tipos_set)))
 
-    filtradas: List[Dict[str, Any]] = []
-    for prop in registros:
-        sigla_tipo = str(prop.get("siglaTipo", "")).upper()
+    indice = _indice_ano(ano)
+    posicoes = _buscar_no_texto(indice, _agulha(termo))
 
-        if tipos and sigla_tipo not in tipos:
-            continue
+    df = indice.df.iloc[posicoes]
+    if tipos_set:
+        df = df[_filtro_tipos(df["siglaTipoUp"], tipos_set)]
+
+    return _decodificar_resultado(df)
+
+
+def buscar_proposicoes_por_tema_anos(
+    termo: str,
+    anos: Iterable[int],
+    tipos: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Como buscar_proposicoes_por_tema, mas para vários anos de uma vez.
 
-        ementa = str(prop.get("ementa", "") or "")
-        keywords = str(prop.get("keywords", "") or "")
-        resumo = str(prop.get("ementaDetalhada", "") or "")
+    Cada ano é buscado numa thread (o GIL fica livre durante o download),
+    todas sobre a mesma SESSION. O resultado vem do ano mais recente para o
+    mais antigo.
+    """
+    if not termo:
+        raise ValueError("O termo de busca não pode ser vazio.")
 
-        texto_busca = " ".join([ementa, keywords, resumo]).lower()
+    anos = sorted({int(a) for a in anos}, reverse=True)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS_ANOS) as ex:
+        por_ano = ex.map(lambda a: buscar_proposicoes_por_tema(termo, a, tipos), anos)
+        return [p for props in por_ano for p in props]
 
-        if termo_lower in texto_busca:
-            filtradas.append(prop)
 
-    try:
-        filtradas.sort(
-            key=lambda p: (int(p.get("ano", 0)), int(p.get("numero", 0))),
-            reverse=True,
+def buscar_proposicoes_api(
+    termo: str,
+    ano: int,
+    tipo: str,
+    itens: int = 100,
+) -> List[Dict[str, Any]]:
+    """
+    Busca pelo endpoint /proposicoes, com o filtro feito pelo servidor
+    (keywords + siglaTipo + ano), seguindo a paginação pelos links "next".
+
+    Os registros vêm no formato resumido da API (sem ementaDetalhada/status)
+    e a busca por keywords é a do servidor; buscar_proposicoes_por_tema
+    completa e confere esses registros quando há um único tipo.
+    """
+    params: Optional[dict] = {
+        "keywords": termo.strip(),
+        "siglaTipo": tipo.upper(),
+        "ano": ano,
+        "itens": itens,
+        "ordem": "DESC",
+        "ordenarPor": "id",
+    }
+    url = "/proposicoes"
+    resultado: List[Dict[str, Any]] = []
+
+    while url:
+        data = _get_api(url, params=params)
+        resultado.extend(_dados(data, list))
+        url = next(
+            (
+                link.get("href")
+                for link in (data.get("links") or [])
+                if link.get("rel") == "next"
+            ),
+            None,
         )
-    except Exception:
-        pass
+        params = None  # o link "next" já traz os parâmetros
+
+    resultado.sort(key=lambda p: (p.get("ano") or 0, p.get("numero") or 0), reverse=True)
+    return resultado
+
+
+def _buscar_tipo_unico(termo: str, ano: int, tipo: str) -> List[Dict[str, Any]]:
+    """
+    buscar_proposicoes_api completada com /proposicoes/{id} de cada achado.
 
-    return filtradas
+    Os detalhes trazem statusProposicao, keywords e ementaDetalhada, então
+    os registros têm as mesmas colunas que os do arquivo anual; com eles,
+    o termo é conferido do mesmo jeito que na busca local.
+    """
+    # Import local: camara_async importa deste módulo.
+    from services.camara_async import enriquecer_lote_sync
+
+    agulha = _agulha(termo)
+    resumos = buscar_proposicoes_api(termo, ano, tipo)
+    detalhes = enriquecer_lote_sync(
+        [p["id"] for p in resumos if p.get("id") is not None],
+        recursos=("detalhes",),
+    )
+
+    resultado: List[Dict[str, Any]] = []
+    for resumo in resumos:
+        det = detalhes.get(resumo.get("id"), {}).get("detalhes")
+        if not det:
+            # Sem detalhes não dá para conferir; fica o que o servidor achou.
+            resultado.append(resumo)
+            continue
+        p = {**resumo, **det}
+        texto = _dobrar(
+            f"{p.get('ementa') or ''} {p.get('keywords') or ''} "
+            f"{p.get('ementaDetalhada') or ''}"
+        )
+        if agulha.isascii():
+            texto = texto.encode("ascii", "ignore").decode("ascii")
+        if agulha in texto:
+            resultado.append(p)
+    return resultado
+
+
+def buscar_proposicoes_por_termos(
+    termos: Iterable[str],
+    ano: int,
+    tipos: Optional[List[str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Versão multi-termo de buscar_proposicoes_por_tema.
+
+    Monta um autômato Aho-Corasick com todos os termos e varre o texto do
+    ano inteiro uma única vez. Retorna {termo: [proposições]}.
+    """
+    originais: Dict[str, str] = {}
+    for t in termos:
+        if t and t.strip():
+            originais.setdefault(_agulha(t), t.strip())
+    if not originais:
+        raise ValueError("Informe ao menos um termo de busca.")
+
+    if len(originais) == 1:
+        termo = next(iter(originais.values()))
+        return {termo: buscar_proposicoes_por_tema(termo, ano, tipos)}
+
+    indice = _indice_ano(ano)
+    posicoes: Dict[str, set] = {t: set() for t in originais.values()}
+    automato = ahocorasick.Automaton()
+    for agulha, termo in originais.items():
+        if agulha.isascii():
+            automato.add_word(agulha, termo)
+        else:
+            posicoes[termo].update(_buscar_no_texto(indice, agulha))
+
+    if len(automato):
+        automato.make_automaton()
+        # Uma única passada do autômato pelo texto inteiro do ano.
+        for fim, termo in automato.iter(indice.texto):
+            posicoes[termo].add(bisect_right(indice.inicios, fim) - 1)
+
+    df = indice.df
+    tipos_set = frozenset(t.upper() for t in (tipos or ()))
+    permitido = (
+        _filtro_tipos(df["siglaTipoUp"], tipos_set).to_numpy() if tipos_set else None
+    )
+
+    return {
+        termo: _decodificar_resultado(
+            df.iloc[[i for i in sorted(linhas) if permitido is None or permitido[i]]]
+        )
+        for termo, linhas in posicoes.items()
+    }
 
 
 def detalhes_proposicao(id_prop: int) -> Dict[str, Any]:
-    data = _get_api(f"/proposicoes/{id_prop}")
-    return data.get("dados", {})
+    data = _get_api(ROTAS_PROPOSICAO["detalhes"].format(id=id_prop))
+    return _dados(data, dict)
 
 
 def tramitacoes(id_prop: int) -> List[Dict[str, Any]]:
-    data = _get_api(f"/proposicoes/{id_prop}/tramitacoes")
-    return data.get("dados", [])
+    data = _get_api(ROTAS_PROPOSICAO["tramitacoes"].format(id=id_prop))
+    return _dados(data, list)
 
 
 def autores_por_proposicao(id_prop: int) -> List[Dict[str, Any]]:
     """
     Busca autores em /proposicoes/{id}/autores.
     """
-    data = _get_api(f"/proposicoes/{id_prop}/autores")
-    if isinstance(data, dict):
-        return data.get("dados", [])
-    elif isinstance(data, list):
-        return data
-    return []
+    data = _get_api(ROTAS_PROPOSICAO["autores"].format(id=id_prop))
+    return _dados(data, list)
 
 
 def autores_por_uri(uri_autores: str) -> List[Dict[str, Any]]:
@@ -129,14 +700,8 @@ def autores_por_uri(uri_autores: str) -> List[Dict[str, Any]]:
     if not uri_autores:
         return []
     try:
-        r = requests.get(uri_autores, timeout=25)
+        r = _get(uri_autores, timeout=25)
         r.raise_for_status()
-        data = r.json()
-        if isinstance(data, dict):
-            return data.get("dados", [])
-        elif isinstance(data, list):
-            return data
-        else:
-            return []
-    except requests.RequestException:
+        return _dados(_loads(r.content), list)
+    except (requests.RequestException, orjson.JSONDecodeError):
         return []
@@ -0,0 +1,118 @@
+# services/camara_async.py
+#
+# Versão assíncrona (aiohttp) das consultas por proposição, para
+# enriquecer vários ids em paralelo no app LegiTrack BR.
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+from services.camara import (
+    BASE_API,
+    ROTAS_PROPOSICAO,
+    TAXA_MAX,
+    TAXA_PERIODO,
+    _dados,
+)
+
+CONCORRENCIA = 16
+LIMITE_POR_HOST = 32
+TENTATIVAS_429 = 3
+ESPERA_MAX = 60.0
+
+# Tipo vazio devolvido para cada recurso quando a consulta falha.
+RECURSOS = {"detalhes": dict, "tramitacoes": list, "autores": list}
+
+
+def _retry_after(valor: Optional[str]) -> float:
+    """Converte o header Retry-After (segundos ou data HTTP) em segundos."""
+    if not valor:
+        return 1.0
+    try:
+        espera = float(valor)
+    except ValueError:
+        try:
+            quando = parsedate_to_datetime(valor)
+            espera = (quando - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return 1.0
+    return min(max(espera, 0.0), ESPERA_MAX)
+
+
+async def _get_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    sem: asyncio.Semaphore,
+    limiter: AsyncLimiter,
+) -> Any:
+    async with sem:
+        for tentativa in range(TENTATIVAS_429 + 1):
+            async with limiter:
+                async with session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=25)
+                ) as r:
+                    if r.status != 429 or tentativa == TENTATIVAS_429:
+                        r.raise_for_status()
+                        return await r.json(content_type=None)
+                    espera = _retry_after(r.headers.get("Retry-After"))
+            await asyncio.sleep(espera)
+
+
+async def _buscar_recursos(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    limiter: AsyncLimiter,
+    id_prop: int,
+    recursos: Sequence[str],
+) -> Dict[str, Any]:
+    """Busca os recursos de uma proposição em paralelo."""
+    urls = [BASE_API + ROTAS_PROPOSICAO[nome].format(id=id_prop) for nome in recursos]
+    respostas = await asyncio.gather(
+        *[_get_json(session, url, sem, limiter) for url in urls],
+        return_exceptions=True,
+    )
+
+    resultado: Dict[str, Any] = {}
+    for nome, resp in zip(recursos, respostas):
+        tipo = RECURSOS[nome]
+        resultado[nome] = tipo() if isinstance(resp, Exception) else _dados(resp, tipo)
+    return resultado
+
+
+async def enriquecer_lote(
+    ids: Iterable[int],
+    recursos: Sequence[str] = ("detalhes", "tramitacoes", "autores"),
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Busca detalhes, tramitações e autores de vários ids ao mesmo tempo.
+
+    Retorna {id: {"detalhes": {...}, "tramitacoes": [...], "autores": [...]}}.
+    Falhas individuais viram dict/list vazios, sem derrubar o lote.
+    """
+    ids_lista: List[int] = list(dict.fromkeys(ids))
+    # Criados aqui, e não no módulo: cada asyncio.run tem seu próprio loop.
+    sem = asyncio.Semaphore(CONCORRENCIA)
+    limiter = AsyncLimiter(max_rate=TAXA_MAX, time_period=TAXA_PERIODO)
+    connector = aiohttp.TCPConnector(limit_per_host=LIMITE_POR_HOST)
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": "LegiTrack/1.0"},
+    ) as session:
+        resultados = await asyncio.gather(
+            *[_buscar_recursos(session, sem, limiter, i, recursos) for i in ids_lista]
+        )
+
+    return dict(zip(ids_lista, resultados))
+
+
+def enriquecer_lote_sync(
+    ids: Iterable[int],
+    recursos: Sequence[str] = ("detalhes", "tramitacoes", "autores"),
+) -> Dict[int, Dict[str, Any]]:
+    """Atalho síncrono de enriquecer_lote, para uso direto no Streamlit."""
+    return asyncio.run(enriquecer_lote(ids, recursos))
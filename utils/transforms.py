@@ -19,135 +19,149 @@ def parse_date(value: Any) -> Optional[pd.Timestamp]:
     """Converte strings da API em Timestamp do pandas."""
     if value in (None, "", pd.NaT):
         return None
+    texto = value if isinstance(value, str) else str(value)
     try:
-        dt = dateparser.parse(str(value))
+        # A Câmara usa ISO 8601; fromisoformat evita as heurísticas do dateutil.
+        return pd.Timestamp(datetime.fromisoformat(texto))
+    except ValueError:
+        pass
+    try:
+        dt = dateparser.parse(texto)
         return pd.to_datetime(dt)
     except Exception:
         return None
 
 
+# Horários sem fuso da API estão no horário de Brasília.
+FUSO_CAMARA = "America/Sao_Paulo"
+_RE_FUSO = r"(?:[zZ]|[+-]\d{2}:?\d{2})$"
+
+
+def parse_datas(valores: pd.Series) -> pd.Series:
+    """
+    Versão vetorizada de parse_date para colunas ISO 8601.
+
+    Aceita valores com e sem fuso misturados: os que têm fuso são levados
+    para o horário de Brasília e o resultado sai sem fuso (naive).
+    """
+    datas = pd.to_datetime(valores, format="ISO8601", errors="coerce", utc=True)
+    com_fuso = valores.astype(str).str.contains(_RE_FUSO, regex=True)
+    locais = datas.dt.tz_convert(FUSO_CAMARA).dt.tz_localize(None)
+    return datas.dt.tz_localize(None).where(~com_fuso, locais)
+
+
+def dias_desde_series(datas: pd.Series) -> pd.Series:
+    """Calcula, de uma vez só, os dias desde cada data até hoje."""
+    datas = pd.to_datetime(datas, errors="coerce")
+    if datas.dt.tz is not None:
+        datas = datas.dt.tz_localize(None)
+    hoje = pd.Timestamp.today().normalize()
+    return (hoje - datas.dt.normalize()).dt.days.astype("Int64")
+
+
 def dias_desde(dt: Any) -> Optional[int]:
     """Calcula dias desde dt até hoje."""
     if dt in (None, "", pd.NaT):
         return None
-    if isinstance(dt, pd.Timestamp):
-        d = dt.date()
-    elif isinstance(dt, datetime):
-        d = dt.date()
-    elif isinstance(dt, date):
-        d = d
-    else:
-        parsed = parse_date(dt)
-        if parsed is None:
+    if not isinstance(dt, (pd.Timestamp, datetime, date)):
+        dt = parse_date(dt)
+        if dt is None:
             return None
-        d = parsed.date()
-
-    hoje = date.today()
-    return (hoje - d).days
+    dias = dias_desde_series(pd.Series([dt]))[0]
+    return None if pd.isna(dias) else int(dias)
 
 
 # ---------------------------------------------------------
-# Auxiliar seguro para buscar campos aninhados
+# DataFrame principal de proposições
 # ---------------------------------------------------------
-def _safe_get(d: Dict[str, Any], *keys, default=None) -> Any:
-    """Busca d[key1][key2]... com fallback."""
-    cur = d
-    try:
-        for k in keys:
-            if cur is None:
-                return default
-            cur = cur.get(k)
-        return cur if cur is not None else default
-    except Exception:
-        return default
+COLUNAS_PROPOSICOES = [
+    "id",
+    "siglaTipo",
+    "numero",
+    "ano",
+    "rotulo",
+    "ementa",
+    "situacao",
+    "tramitacao_atual",
+    "data_status",
+    "dias_desde_status",
+    "link",
+]
+
+COLUNAS_CATEGORICAS = ["siglaTipo", "situacao", "tramitacao_atual"]
+
+# status pode vir em diversos formatos
+PREFIXOS_STATUS = ("statusProposicao", "ultimoStatus", "status_proposicao")
+
+LINK_FICHA = "https://www.camara.leg.br/proposicoesWeb/fichadetramitacao?idProposicao="
+
+
+def _coalesce(df: pd.DataFrame, colunas: List[str]) -> pd.Series:
+    """Primeiro valor não vazio entre as colunas (equivalente vetorizado de `a or b`)."""
+    resultado = pd.Series(None, index=df.index, dtype=object)
+    for c in colunas:
+        if c in df.columns:
+            col = df[c].astype(object)
+            resultado = resultado.combine_first(col.mask(col.eq("")))
+    return resultado.where(resultado.notna(), None)
+
+
+def _coalesce_status(df: pd.DataFrame, *chaves: str) -> pd.Series:
+    return _coalesce(df, [f"{p}.{k}" for p in PREFIXOS_STATUS for k in chaves])
 
 
-# ---------------------------------------------------------
-# DataFrame principal de proposições
-# ---------------------------------------------------------
 def df_proposicoes(registros: List[Dict[str, Any]]) -> pd.DataFrame:
     """Transforma lista de proposições em DataFrame padronizado."""
-    linhas: List[Dict[str, Any]] = []
-
-    for p in registros:
-        id_prop = p.get("id") or p.get("idProposicao")
-        sigla_tipo = p.get("siglaTipo") or p.get("sigla_tipo")
-        numero = p.get("numero") or p.get("numProposicao") or p.get("num")
-        ano = p.get("ano") or p.get("anoProposicao")
-
-        ementa = p.get("ementa") or ""
-        ementa_det = p.get("ementaDetalhada") or ""
-
-        # status pode vir em diversos formatos
-        status = (
-            p.get("statusProposicao")
-            or p.get("ultimoStatus")
-            or p.get("status_proposicao")
-            or {}
-        )
-
-        situacao = (
-            _safe_get(status, "descricaoSituacao")
-            or _safe_get(status, "situacao")
-            or _safe_get(status, "descricaoTramitacao")
-        )
-
-        tramitacao_atual = (
-            _safe_get(status, "descricaoTramitacao")
-            or _safe_get(status, "apreciacao")
-        )
-
-        data_status_raw = (
-            _safe_get(status, "dataHora")
-            or _safe_get(status, "dataUltimoDespacho")
-            or _safe_get(status, "data")
-        )
-
-        data_status = parse_date(data_status_raw)
-
-        # link oficial
-        if id_prop:
-            link = f"https://www.camara.leg.br/proposicoesWeb/fichadetramitacao?idProposicao={id_prop}"
-        else:
-            link = ""
-
-        rotulo = None
-        if sigla_tipo and numero and ano:
-            rotulo = f"{sigla_tipo} {numero}/{ano}"
-
-        linhas.append(
-            {
-                "id": id_prop,
-                "siglaTipo": sigla_tipo,
-                "numero": numero,
-                "ano": ano,
-                "rotulo": rotulo,
-                "ementa": ementa or ementa_det,
-                "situacao": situacao,
-                "tramitacao_atual": tramitacao_atual,
-                "data_status": data_status,
-                "link": link,
-            }
-        )
-
-    if not linhas:
-        return pd.DataFrame(
-            columns=[
-                "id",
-                "siglaTipo",
-                "numero",
-                "ano",
-                "rotulo",
-                "ementa",
-                "situacao",
-                "tramitacao_atual",
-                "data_status",
-                "link",
-            ]
-        )
-
-    df = pd.DataFrame(linhas)
-    return df
+    if not registros:
+        return pd.DataFrame(columns=COLUNAS_PROPOSICOES)
+
+    bruto = pd.json_normalize(registros, max_level=1)
+
+    id_prop = pd.to_numeric(
+        _coalesce(bruto, ["id", "idProposicao"]), errors="coerce"
+    ).astype("Int64")
+    sigla_tipo = _coalesce(bruto, ["siglaTipo", "sigla_tipo"])
+    numero = pd.to_numeric(
+        _coalesce(bruto, ["numero", "numProposicao", "num"]), errors="coerce"
+    ).astype("Int64")
+    ano = pd.to_numeric(
+        _coalesce(bruto, ["ano", "anoProposicao"]), errors="coerce"
+    ).astype("Int64")
+
+    tem_rotulo = sigla_tipo.notna() & numero.fillna(0).ne(0) & ano.fillna(0).ne(0)
+    rotulo = (
+        sigla_tipo.astype(str) + " " + numero.astype(str) + "/" + ano.astype(str)
+    ).astype(object).where(tem_rotulo, None)
+
+    link = (LINK_FICHA + id_prop.astype(str)).where(id_prop.notna(), "")
+
+    df = pd.DataFrame(
+        {
+            "id": id_prop,
+            "siglaTipo": sigla_tipo,
+            "numero": numero,
+            "ano": ano,
+            "rotulo": rotulo,
+            "ementa": _coalesce(bruto, ["ementa", "ementaDetalhada"]).fillna(""),
+            "situacao": _coalesce_status(
+                bruto, "descricaoSituacao", "situacao", "descricaoTramitacao"
+            ),
+            "tramitacao_atual": _coalesce_status(
+                bruto, "descricaoTramitacao", "apreciacao"
+            ),
+            "data_status": parse_datas(
+                _coalesce_status(bruto, "dataHora", "dataUltimoDespacho", "data")
+            ),
+            "link": link,
+        }
+    )
+    df["dias_desde_status"] = dias_desde_series(df["data_status"])
+
+    # Poucos valores distintos: category guarda só um código inteiro por linha.
+    for coluna in COLUNAS_CATEGORICAS:
+        df[coluna] = df[coluna].astype("category")
+
+    return df.reindex(columns=COLUNAS_PROPOSICOES)
 
 
 # ---------------------------------------------------------